@@ -3,8 +3,9 @@
 
 import os
 import re
-from config import CAR_EXTENSIONS, DRIVER_PATTERNS, ENCODINGS
+from config import CAR_EXTENSIONS, DRIVER_PATTERNS
 from debug_logger import logger
+from file_reader import FileReader
 
 class CarHandler:
     """Handles all .car file operations"""
@@ -108,17 +109,13 @@ class CarHandler:
     
     @staticmethod
     def _read_file_with_fallback(file_path, debug=False):
-        """Try to read a file with multiple encodings"""
-        for encoding in ENCODINGS:
-            try:
-                with open(file_path, 'r', encoding=encoding, errors='ignore') as f:
-                    content = f.read()
-                return content
-            except Exception:
-                continue
-        
-        logger.error(f"Failed to read file: {file_path}")
-        return None
+        """Read a file once and decode it with the same fallback as .rcd files"""
+        try:
+            text, _ = FileReader.read_text(file_path)
+        except OSError:
+            logger.error(f"Failed to read file: {file_path}")
+            return None
+        return text
     
     @staticmethod
     def _clean_driver_name(driver_name):
@@ -13,11 +13,30 @@ DEFAULT_OUTPUT_FILE = "result.csv"
 # Default config file
 DEFAULT_CONFIG_FILE = "cfg.yml"
 
+# Editor lazy population: above this many drivers, only the first chunk is
+# shown on first paint and the rest is added in chunks from the event loop
+EDITOR_LAZY_LOAD_THRESHOLD = 1000
+EDITOR_CHUNK_SIZE = 200
+
 # Default folder structure (GTR2 specific)
 DEFAULT_TEAMS_FOLDER = "GameData/Teams"
 
-# Encoding to try (in order)
-ENCODINGS = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+# Minimum RapidFuzz WRatio score (0-100) for a fuzzy driver name match
+FUZZY_MATCH_SCORE_CUTOFF = 80
+
+# Parse .rcd files in worker processes when at least this many are found
+# (below that, starting the processes costs more than it saves)
+RCD_PARALLEL_MIN_FILES = 1000
+
+# Rewrite .rcd files in worker processes when at least this many need updating
+RCD_PARALLEL_UPDATE_MIN_FILES = 1000
+
+# Re-read changed .rcd files for the driver cache on a thread pool above this many
+RCD_THREADED_MIN_FILES = 32
+
+# Encoding to try (in order) for .car and .rcd files without a BOM
+# (latin-1 never fails, so it goes last: it only catches bytes cp1252 leaves undefined)
+ENCODINGS = ['utf-8', 'cp1252', 'latin-1']
 
 # Driver name patterns for .car files
 DRIVER_PATTERNS = [
@@ -21,6 +21,12 @@ class DebugLogger:
             else:
                 print(f"    {details}")
     
+    def log_lines(self, messages, level="INFO"):
+        """Log several messages of the same level with a single print"""
+        if messages:
+            icon = self._get_icon(level)
+            print("\n".join(f"{icon} {message}" for message in messages))
+    
     def section(self, title, width=60):
         """Print a section header"""
         print(f"\n{'='*width}")
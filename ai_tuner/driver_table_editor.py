@@ -8,12 +8,15 @@ import os
 import threading
 from debug_logger import logger
 from rcd_handler import RcdHandler  # Changed import
+from config import EDITOR_CHUNK_SIZE
 
 class DriverTableEditor:
     """Editable driver data table with virtual scrolling for performance"""
     
-    def __init__(self, data, fieldnames, csv_file_path, install_folder=None, teams_folder=None):
-        self.data = data  # List of dictionaries
+    def __init__(self, data, fieldnames, csv_file_path, install_folder=None, teams_folder=None,
+                 deferred_data=None):
+        self.data = data  # List of dictionaries shown on first paint
+        self.deferred_data = list(deferred_data or [])  # Rows added in chunks after first paint
         self.fieldnames = fieldnames  # List of column names
         self.csv_file_path = csv_file_path
         self.install_folder = install_folder
@@ -27,8 +30,8 @@ class DriverTableEditor:
         # Fields to exclude
         self.excluded_fields = ['Abbreviation', 'Nationality', 'NatAbbrev', 'Script']
         
-        # Convert to DataFrame for easier manipulation
-        self.df = pd.DataFrame(data)
+        # Convert to DataFrame for easier manipulation (all rows, including deferred ones)
+        self.df = pd.DataFrame(data + self.deferred_data)
         
         # Track changes
         self.changes_made = False
@@ -42,46 +45,100 @@ class DriverTableEditor:
         self.prepare_data()
         
         self.setup_ui()
+        
+        # Populate remaining drivers in the background of the event loop
+        if self.deferred_data:
+            self.root.after(10, self.populate_next_chunk)
     
     def prepare_data(self):
         """Pre-calculate and prepare data for faster access"""
-        # Get all drivers and variables
-        self.all_drivers = list(self.df['Driver'])
+        # Get all variables (drivers are added by load_drivers)
+        self.all_drivers = []
         self.all_variables = self.get_variables()
         
         # Create dictionaries for faster lookup
-        self.driver_to_index = {driver: idx for idx, driver in enumerate(self.all_drivers)}
+        self.driver_to_index = {}
         self.variable_to_index = {variable: idx for idx, variable in enumerate(self.all_variables)}
         
         # Store original values for change tracking
         self.original_values = {}
         self.current_values = {}
         
-        for variable in self.all_variables:
-            for driver in self.all_drivers:
-                value = self.df.loc[self.df['Driver'] == driver, variable]
-                cell_value = ""
-                if not value.empty:
-                    cell_value = str(value.iloc[0])
-                    # Format numeric values for display
-                    try:
-                        float_val = float(cell_value)
-                        cell_value = f"{float_val:.3f}".rstrip('0').rstrip('.')
-                    except (ValueError, TypeError):
-                        pass
-                
-                key = (variable, driver)
-                self.original_values[key] = cell_value
-                self.current_values[key] = cell_value
-        
         # Track visibility state
-        self.driver_visible = {driver: True for driver in self.all_drivers}
+        self.driver_visible = {}
         self.variable_visible = {variable: True for variable in self.all_variables}
         self.is_filtered = False
+        self.driver_filter = None  # Lowercased filter text while a driver-name filter is active
+        
+        # Every driver gets a column up front, so loading a chunk only reveals columns
+        # and fills cells instead of rebuilding the table
+        drivers = (row.get('Driver') for row in self.data + self.deferred_data)
+        self.column_ids = ["Variable"] + [driver for driver in dict.fromkeys(drivers) if driver is not None]
+        self.variable_items = {}  # Variable -> tree item id
+        
+        self.load_drivers(self.data)
         
         # Get filtered lists
         self.update_filtered_lists()
     
+    def load_drivers(self, rows):
+        """Add drivers from a list of row dictionaries to the lookup tables"""
+        new_drivers = []
+        for row in rows:
+            driver = row.get('Driver')
+            if driver is None or driver in self.driver_to_index:
+                continue
+            
+            self.driver_to_index[driver] = len(self.all_drivers)
+            self.all_drivers.append(driver)
+            self.driver_visible[driver] = True
+            new_drivers.append(driver)
+            
+            for variable in self.all_variables:
+                value = row.get(variable)
+                cell_value = "" if value is None else str(value)
+                # Format numeric values for display
+                try:
+                    float_val = float(cell_value)
+                    cell_value = f"{float_val:.3f}".rstrip('0').rstrip('.')
+                except (ValueError, TypeError):
+                    pass
+                
+                key = (variable, driver)
+                self.original_values[key] = cell_value
+                self.current_values[key] = cell_value
+        
+        return new_drivers
+    
+    def populate_next_chunk(self):
+        """Add the next chunk of deferred drivers to the table"""
+        if not self.deferred_data or not self.root.winfo_exists():
+            return
+        
+        chunk = self.deferred_data[:EDITOR_CHUNK_SIZE]
+        del self.deferred_data[:EDITOR_CHUNK_SIZE]
+        
+        new_drivers = self.load_drivers(chunk)
+        if new_drivers:
+            # New drivers follow an active driver-name filter
+            if self.is_filtered and self.driver_filter is not None:
+                for driver in new_drivers:
+                    self.driver_visible[driver] = self.driver_filter in driver.lower()
+            self.visible_drivers.extend(driver for driver in new_drivers if self.driver_visible[driver])
+            
+            # Fill only the new drivers' cells, then reveal their columns
+            for variable, item_id in self.variable_items.items():
+                for driver in new_drivers:
+                    self.tree.set(item_id, driver, self.current_values.get((variable, driver), ""))
+            
+            self.update_tree_columns()
+            self.update_stats()
+        
+        if self.deferred_data:
+            self.root.after(10, self.populate_next_chunk)
+        else:
+            self.update_stats()
+    
     def get_variables(self):
         """Get the list of variables to display (excluding metadata and excluded fields)"""
         metadata_columns = ['Driver', 'Source_CAR_File', 'CAR_File_Path', 'Original_CAR_Name']
@@ -167,12 +224,9 @@ class DriverTableEditor:
         table_container = ttk.Frame(main_frame)
         table_container.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         
-        # Create Treeview with scrollbars - store column IDs
-        columns = ["Variable"] + self.all_drivers
-        self.tree = ttk.Treeview(table_container, columns=columns, show="headings", height=25)
-        
-        # Store column IDs for easy reference
-        self.column_ids = columns
+        # Create Treeview with scrollbars; only loaded, visible drivers are displayed
+        self.tree = ttk.Treeview(table_container, columns=self.column_ids, show="headings", height=25)
+        self.update_tree_columns()
         
         # Configure scrollbars
         v_scrollbar = ttk.Scrollbar(table_container, orient="vertical", command=self.tree.yview)
@@ -193,13 +247,7 @@ class DriverTableEditor:
         self.root.rowconfigure(0, weight=1)
         
         # Configure tree columns
-        self.tree.heading("Variable", text="Variable")
-        self.tree.column("Variable", width=200, minwidth=150)
-        
-        for driver in self.all_drivers:
-            display_name = driver[:15] + "..." if len(driver) > 15 else driver
-            self.tree.heading(driver, text=display_name)
-            self.tree.column(driver, width=100, minwidth=80)
+        self.configure_tree_columns()
         
         # Populate tree with data
         self.populate_tree()
@@ -214,22 +262,35 @@ class DriverTableEditor:
         # Bind filter entry to apply on Enter key
         filter_entry.bind("<Return>", lambda e: self.apply_filter())
     
+    def configure_tree_columns(self):
+        """Set heading text and width for every tree column"""
+        self.tree.heading("Variable", text="Variable")
+        self.tree.column("Variable", width=200, minwidth=150)
+        
+        for driver in self.column_ids[1:]:
+            display_name = driver[:15] + "..." if len(driver) > 15 else driver
+            self.tree.heading(driver, text=display_name)
+            self.tree.column(driver, width=100, minwidth=80)
+    
     def populate_tree(self):
         """Populate the tree with data from visible variables"""
         # Clear existing items
         for item in self.tree.get_children():
             self.tree.delete(item)
+        self.variable_items = {}
         
-        # Add rows for visible variables
+        # Add rows for visible variables (values in column order; hidden columns just aren't displayed)
+        drivers = self.column_ids[1:]
         for variable in self.visible_variables:
             values = [variable]
-            for driver in self.visible_drivers:
+            for driver in drivers:
                 key = (variable, driver)
                 values.append(self.current_values.get(key, ""))
             
             item_id = self.tree.insert("", "end", values=values)
             # Store variable name in item for reference
             self.tree.set(item_id, "Variable", variable)
+            self.variable_items[variable] = item_id
     
     def update_stats(self):
         """Update statistics label"""
@@ -241,6 +302,9 @@ class DriverTableEditor:
         else:
             stats_text = f"Drivers: {len(self.all_drivers)} | Variables: {len(self.all_variables)}"
         
+        if self.deferred_data:
+            stats_text += f" (loading {len(self.deferred_data)} more...)"
+        
         self.stats_label.config(text=stats_text)
     
     def apply_filter(self):
@@ -283,6 +347,7 @@ class DriverTableEditor:
             return
         
         self.is_filtered = True
+        self.driver_filter = filter_text if filtered_drivers else None
         self.update_filtered_lists()
         
         # Update tree columns based on visible drivers
@@ -303,20 +368,14 @@ class DriverTableEditor:
     
     def update_tree_columns(self):
         """Update tree columns based on visible drivers"""
-        # Show/hide columns
-        for col in self.column_ids:
-            if col == "Variable":
-                continue
-            
-            if self.driver_visible.get(col, False):
-                self.tree.column(col, stretch=True, width=100)
-            else:
-                self.tree.column(col, stretch=False, minwidth=0, width=0)
+        # Show only loaded, visible drivers (in load order)
+        self.tree.configure(displaycolumns=["Variable"] + self.visible_drivers)
     
     def clear_filter(self):
         """Clear filter and show all data"""
         self.filter_var.set("")
         self.is_filtered = False
+        self.driver_filter = None
         
         # Set all to visible
         for driver in self.all_drivers:
@@ -327,9 +386,7 @@ class DriverTableEditor:
         self.update_filtered_lists()
         
         # Show all columns
-        for col in self.column_ids:
-            if col != "Variable":
-                self.tree.column(col, stretch=True, width=100)
+        self.update_tree_columns()
         
         # Repopulate tree
         self.populate_tree()
@@ -393,17 +450,10 @@ class DriverTableEditor:
     
     def update_tree_cell(self, item, driver, new_value):
         """Update a single cell in the tree"""
-        # Get current values
-        values = list(self.tree.item(item)['values'])
-        
-        # Find driver index in visible_drivers
         try:
-            driver_index = self.visible_drivers.index(driver)
-            # Update value (add 1 for Variable column)
-            values[driver_index + 1] = new_value
-            self.tree.item(item, values=values)
-        except (ValueError, IndexError):
-            pass  # Driver not in visible list
+            self.tree.set(item, driver, new_value)
+        except tk.TclError:
+            pass  # Row rebuilt by a filter change while the edit dialog was open
     
     def save_all(self):
         """Save changes to CSV and update RCD files in one operation"""
@@ -471,9 +521,9 @@ class DriverTableEditor:
             data = self.df.to_dict('records')
             
             # Filter fieldnames to exclude metadata fields
-            editable_fields = [f for f in self.fieldnames 
-                             if f not in ['Driver', 'Source_CAR_File', 'CAR_File_Path', 'Original_CAR_Name']
-                             and f not in self.excluded_fields]
+            excluded = frozenset(['Driver', 'Source_CAR_File', 'CAR_File_Path', 'Original_CAR_Name'])
+            excluded |= frozenset(self.excluded_fields)
+            editable_fields = [f for f in self.fieldnames if f not in excluded]
             
             # Update RCD files using the unified handler
             success_count, error_count, backup_path = self.rcd_handler.update_rcd_files(
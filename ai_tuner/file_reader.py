@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# file_reader.py - Text file decoding shared by the .car and .rcd handlers
+
+import codecs
+from config import ENCODINGS
+
+class FileReader:
+    """Reads game text files with one encoding fallback for every file type"""
+    
+    @staticmethod
+    def read_text(file_path):
+        """
+        Read a file once and decode it in memory
+        
+        A BOM selects UTF-8/UTF-16 directly; otherwise ENCODINGS are tried in
+        order on the bytes already read, without reopening the file.
+        
+        Args:
+            file_path: Path of the file to read
+        
+        Returns:
+            Tuple of (text, encoding); raises OSError if the file can't be read
+        """
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        
+        if data.startswith(codecs.BOM_UTF8):
+            encodings = ('utf-8-sig',)
+        elif data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            encodings = ('utf-16',)
+        else:
+            encodings = ENCODINGS
+        
+        for encoding in encodings:
+            try:
+                return data.decode(encoding), encoding
+            except UnicodeDecodeError:
+                continue
+        
+        return data.decode('utf-8', errors='replace'), 'utf-8'
@@ -5,8 +5,73 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
 import threading
-import yaml
+import functools
+import importlib
+from concurrent.futures import ThreadPoolExecutor
 from debug_logger import logger
+from config import EDITOR_LAZY_LOAD_THRESHOLD, EDITOR_CHUNK_SIZE
+
+# Optional: reload cfg.yml when it is edited outside the GUI
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml():
+    """Import PyYAML on first use (keeps it off the window startup path)
+    
+    Returns:
+        Tuple of (yaml module, loader class, yaml.dump keyword arguments),
+        preferring the libyaml bindings and falling back to the pure-Python
+        implementation
+    """
+    yaml = importlib.import_module('yaml')
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    dump_options = {
+        'Dumper': getattr(yaml, 'CSafeDumper', yaml.SafeDumper),
+        'default_flow_style': False,
+    }
+    return yaml, loader, dump_options
+
+
+# Parsed config cache: path -> (mtime_ns, config)
+_yaml_cache = {}
+
+
+def _load_yaml_cached(path):
+    """Load a YAML file, reusing the parsed result while its mtime is unchanged"""
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _yaml_cache.get(path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+    
+    yaml, loader, _ = _yaml()
+    with open(path, 'r') as f:
+        config = yaml.load(f, Loader=loader)
+    _yaml_cache[path] = (mtime_ns, config)
+    return config
+
+
+class ConfigFileHandler(FileSystemEventHandler):
+    """Watchdog handler that notifies the GUI when the config file changes"""
+    
+    def __init__(self, config_path, callback):
+        super().__init__()
+        self.config_path = os.path.abspath(config_path)
+        self.callback = callback
+    
+    def on_any_event(self, event):
+        if event.event_type not in ('created', 'modified', 'moved'):
+            return
+        
+        paths = (event.src_path, getattr(event, 'dest_path', ''))
+        if any(path and os.path.abspath(path) == self.config_path for path in paths):
+            self.callback()
+
 
 class DriverExtractorGUI:
     """Simple GUI for the Driver Extractor tool"""
@@ -23,15 +88,31 @@ class DriverExtractorGUI:
         self.teams_folder = tk.StringVar()
         self.debug_mode = tk.BooleanVar(value=False)
         
+        # Whether the config file's folder exists (checked once, not on every trace write)
+        config_dir = os.path.dirname(os.path.abspath(self.config_file.get()))
+        self._cfg_dir_ok = os.path.isdir(config_dir or ".")
+        
         # Store extraction results
         self.extraction_result = None
         self.extraction_fieldnames = None
         
+        # Background writer for result.csv, reused across extractions; long jobs run on
+        # daemon threads instead, so closing the window doesn't wait for them
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gtr2')
+        
+        # Config file watcher (only if watchdog is installed)
+        self._config_observer = None
+        self._last_saved_mtime_ns = None
+        
         self.setup_ui()
         self.load_config()
+        self.start_config_watcher()
     
     def setup_ui(self):
         """Setup the user interface"""
+        # Buttons toggled by disable_buttons/enable_buttons
+        self._buttons = []
+        
         # Main container
         main_frame = ttk.Frame(self.root, padding="20")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -60,9 +141,9 @@ class DriverExtractorGUI:
         install_entry = ttk.Entry(main_frame, textvariable=self.install_folder, width=40)
         install_entry.grid(row=2, column=1, padx=(10, 5), pady=5, sticky=(tk.W, tk.E))
         
-        ttk.Button(main_frame, text="Browse...", command=self.browse_install).grid(
-            row=2, column=2, padx=(0, 0), pady=5
-        )
+        browse_install_button = ttk.Button(main_frame, text="Browse...", command=self.browse_install)
+        browse_install_button.grid(row=2, column=2, padx=(0, 0), pady=5)
+        self._buttons.append(browse_install_button)
         
         # Teams folder selection
         ttk.Label(main_frame, text="Teams Folder:").grid(
@@ -72,9 +153,9 @@ class DriverExtractorGUI:
         teams_entry = ttk.Entry(main_frame, textvariable=self.teams_folder, width=40)
         teams_entry.grid(row=3, column=1, padx=(10, 5), pady=5, sticky=(tk.W, tk.E))
         
-        ttk.Button(main_frame, text="Browse...", command=self.browse_teams).grid(
-            row=3, column=2, padx=(0, 0), pady=5
-        )
+        browse_teams_button = ttk.Button(main_frame, text="Browse...", command=self.browse_teams)
+        browse_teams_button.grid(row=3, column=2, padx=(0, 0), pady=5)
+        self._buttons.append(browse_teams_button)
         
         # Debug mode checkbox
         debug_check = ttk.Checkbutton(
@@ -108,6 +189,7 @@ class DriverExtractorGUI:
             state='normal'
         )
         self.main_action_button.pack(side=tk.LEFT, padx=(0, 10))
+        self._buttons.append(self.main_action_button)
         
         ttk.Button(button_frame, text="Exit", command=self.safe_quit).pack(
             side=tk.LEFT, padx=(10, 0)
@@ -137,8 +219,7 @@ Click 'Extract & Edit Talent Data' to extract driver data and open the editor.
     
     def auto_save_config(self, *args):
         """Automatically save config when values change"""
-        config_path = self.config_file.get()
-        if config_path and os.path.exists(os.path.dirname(config_path) if os.path.dirname(config_path) else "."):
+        if self._cfg_dir_ok and self.config_file.get():
             self.save_config(silent=True)
     
     def extract_and_edit(self):
@@ -158,8 +239,7 @@ Click 'Extract & Edit Talent Data' to extract driver data and open the editor.
             return
         
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = _load_yaml_cached(config_path) or {}
             
             if 'gtr2_install' in config:
                 self.install_folder.set(config['gtr2_install'])
@@ -192,8 +272,12 @@ Click 'Extract & Edit Talent Data' to extract driver data and open the editor.
         }
         
         try:
+            yaml, _, dump_options = _yaml()
             with open(config_path, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
+                yaml.dump(config, f, **dump_options)
+            
+            # Remember our own write so the watcher doesn't reload it
+            self._last_saved_mtime_ns = os.stat(config_path).st_mtime_ns
             
             if not silent:
                 self.status_label.config(text=f"Config saved: {os.path.basename(config_path)}", foreground="green")
@@ -203,15 +287,67 @@ Click 'Extract & Edit Talent Data' to extract driver data and open the editor.
             if not silent:
                 messagebox.showerror("Error", f"Failed to save config:\n{str(e)}")
     
+    @staticmethod
+    def _subfolders(path):
+        """Map lowercased sub-folder names to their paths with a single directory read"""
+        try:
+            with os.scandir(path) as it:
+                return {entry.name.lower(): entry.path for entry in it if entry.is_dir()}
+        except OSError:
+            return {}
+    
+    def _locate_game_folders(self, install_folder):
+        """Return (GameData path, GameData/Teams path) under an install folder, None if missing"""
+        game_data = self._subfolders(install_folder).get("gamedata")
+        if not game_data:
+            return None, None
+        return game_data, self._subfolders(game_data).get("teams")
+    
+    def _ask_directory(self, **options):
+        """Show a directory picker owned by the main window"""
+        # Flush pending redraws first so the native dialog doesn't open over a stale window
+        self.root.update_idletasks()
+        return filedialog.askdirectory(parent=self.root, **options)
+    
+    def start_config_watcher(self):
+        """Watch the config file for external edits and reload it"""
+        if Observer is None or not self._cfg_dir_ok:
+            return
+        
+        config_path = os.path.abspath(self.config_file.get())
+        handler = ConfigFileHandler(
+            config_path,
+            lambda: self.root.after(0, self.reload_config_if_changed)
+        )
+        
+        try:
+            self._config_observer = Observer()
+            self._config_observer.daemon = True
+            self._config_observer.schedule(handler, os.path.dirname(config_path), recursive=False)
+            self._config_observer.start()
+        except Exception as e:
+            logger.warning(f"Config file watcher not available: {e}")
+            self._config_observer = None
+    
+    def reload_config_if_changed(self):
+        """Reload the config unless the change was our own auto-save"""
+        try:
+            mtime_ns = os.stat(self.config_file.get()).st_mtime_ns
+        except OSError:
+            return
+        
+        if mtime_ns != self._last_saved_mtime_ns:
+            self.load_config()
+    
     def browse_install(self):
         """Browse for GTR2 installation folder"""
-        folder = filedialog.askdirectory(title="Select GTR2 Installation Folder")
+        folder = self._ask_directory(title="Select GTR2 Installation Folder")
         if folder:
             self.install_folder.set(folder)
             
             # Auto-set teams folder to default location
-            default_teams = os.path.join(folder, "GameData", "Teams")
-            if os.path.exists(default_teams):
+            _, default_teams = self._locate_game_folders(folder)
+            if default_teams:
                 self.teams_folder.set(default_teams)
     
     def browse_teams(self):
@@ -221,23 +357,15 @@ Click 'Extract & Edit Talent Data' to extract driver data and open the editor.
         
         # If no teams folder is set, try to use default based on GTR2 install
         if not initial_dir and self.install_folder.get():
-            default_teams = os.path.join(self.install_folder.get(), "GameData", "Teams")
-            if os.path.exists(default_teams):
-                initial_dir = default_teams
-            else:
-                # Try just the GameData folder
-                game_data = os.path.join(self.install_folder.get(), "GameData")
-                if os.path.exists(game_data):
-                    initial_dir = game_data
-                else:
-                    # Fall back to GTR2 install folder
-                    initial_dir = self.install_folder.get()
+            # Prefer GameData/Teams, then GameData, then the GTR2 install folder
+            game_data, default_teams = self._locate_game_folders(self.install_folder.get())
+            initial_dir = default_teams or game_data or self.install_folder.get()
         
         # If still no initial directory, use current directory
         if not initial_dir:
             initial_dir = "."
         
-        folder = filedialog.askdirectory(
+        folder = self._ask_directory(
             title="Select Teams Folder",
             initialdir=initial_dir
         )
@@ -268,33 +396,26 @@ Click 'Extract & Edit Talent Data' to extract driver data and open the editor.
         # Show loading message and start progress bar
         self.loading_label.config(text="Processing data, please wait...", foreground="blue")
         self.status_label.config(text="Processing...", foreground="blue")
-        self.progress.start()
+        # Tick every 200ms instead of the default 50ms to keep Tcl wakeups low
+        self.progress.start(200)
         
         # Disable buttons during processing
         self.disable_buttons()
         
         # Run extraction in a separate thread
-        thread = threading.Thread(target=self.run_extraction)
-        thread.daemon = True
-        thread.start()
+        threading.Thread(target=self.run_extraction, daemon=True).start()
         
         return True
     
     def disable_buttons(self):
         """Disable buttons during processing"""
-        self.main_action_button.state(['disabled'])
-        for widget in self.root.winfo_children():
-            for child in widget.winfo_children():
-                if isinstance(child, ttk.Button):
-                    child.state(['disabled'])
+        for button in self._buttons:
+            button.state(['disabled'])
     
     def enable_buttons(self):
         """Enable buttons after processing"""
-        self.main_action_button.state(['!disabled'])
-        for widget in self.root.winfo_children():
-            for child in widget.winfo_children():
-                if isinstance(child, ttk.Button):
-                    child.state(['!disabled'])
+        for button in self._buttons:
+            button.state(['!disabled'])
     
     def run_extraction(self):
         """Run the extraction in a separate thread"""
@@ -317,36 +438,51 @@ Click 'Extract & Edit Talent Data' to extract driver data and open the editor.
             if result:
                 data, fieldnames = result
                 if data:
-                    # Use default output filename
-                    output_file = "result.csv"
-                    csv_success = CSVWriter.write_drivers_to_csv(data, fieldnames, output_file)
-                    
                     # Store results for viewer
                     self.extraction_result = data
                     self.extraction_fieldnames = fieldnames
                     
+                    # Write the CSV in the background; the editor works from the in-memory data
+                    output_file = "result.csv"
+                    future = self._pool.submit(CSVWriter.write_drivers_to_csv, data, fieldnames, output_file)
+                    future.add_done_callback(functools.partial(self.check_csv_write, output_file))
+                    
                     # Schedule GUI updates on the main thread
-                    self.root.after(0, self.handle_extraction_result, csv_success, data, fieldnames)
+                    self.root.after(0, self.handle_extraction_result, data, fieldnames)
                 else:
-                    self.root.after(0, self.handle_extraction_result, False, None, None)
+                    self.root.after(0, self.handle_extraction_result, None, None)
             else:
-                self.root.after(0, self.handle_extraction_result, False, None, None)
+                self.root.after(0, self.handle_extraction_result, None, None)
             
         except Exception as e:
             # Schedule error display on the main thread
             self.root.after(0, self.handle_extraction_error, e)
     
-    def handle_extraction_result(self, csv_success, data, fieldnames):
+    def check_csv_write(self, output_file, future):
+        """Report a failed background CSV write on the main GUI thread"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None or not future.result():
+            self.root.after(0, self.handle_csv_write_error, output_file, error)
+    
+    def handle_csv_write_error(self, output_file, error=None):
+        """Show a failed CSV write on the main GUI thread"""
+        details = f":\n{error}" if error else ""
+        self.status_label.config(text=f"Failed to write {output_file}", foreground="red")
+        messagebox.showerror("Error", f"Failed to write {output_file}{details}")
+    
+    def handle_extraction_result(self, data, fieldnames):
         """Handle extraction result on the main GUI thread"""
         self.progress.stop()
         
-        if csv_success and data:
+        if data:
             # Update loading message to show we're preparing the editor
             self.loading_label.config(text="Preparing talent editor...", foreground="green")
             self.status_label.config(text="Extraction completed!", foreground="green")
             
-            # Schedule the editor to open after a brief pause
-            self.root.after(100, lambda: self.prepare_and_open_viewer(data, fieldnames))
+            # Open the editor as soon as the status labels have been redrawn
+            self.root.after_idle(self.prepare_and_open_viewer, data, fieldnames)
         else:
             self.loading_label.config(text="", foreground="")
             self.status_label.config(text="Extraction failed", foreground="red")
@@ -363,9 +499,9 @@ Click 'Extract & Edit Talent Data' to extract driver data and open the editor.
             self.root.update_idletasks()
             
             # Create the editor in the background
-            threading.Thread(target=self.create_and_show_editor, 
-                           args=(data, fieldnames), 
-                           daemon=True).start()
+            threading.Thread(target=self.create_and_show_editor,
+                             args=(data, fieldnames),
+                             daemon=True).start()
             
         except Exception as e:
             logger.error(f"Error preparing editor: {e}")
@@ -375,9 +511,10 @@ Click 'Extract & Edit Talent Data' to extract driver data and open the editor.
             self.enable_buttons()
     
     def create_and_show_editor(self, data=None, fieldnames=None):
-        """Create and show the editor in a separate thread"""
+        """Load editor data in a separate thread, then build the editor on the main thread"""
         try:
-            from driver_table_editor import DriverTableEditor
+            # Import here so pandas is loaded off the main thread
+            import driver_table_editor
             
             # Use provided data or load from file
             if data is None or fieldnames is None:
@@ -390,10 +527,27 @@ Click 'Extract & Edit Talent Data' to extract driver data and open the editor.
                     return
                 
                 # Load data from CSV
-                import pandas as pd
-                df = pd.read_csv(output_file, encoding='utf-8')
-                data = df.to_dict('records')
-                fieldnames = list(df.columns)
+                import csv
+                with open(output_file, 'r', newline='', encoding='utf-8') as f:
+                    reader = csv.DictReader(f)
+                    data = list(reader)
+                    fieldnames = list(reader.fieldnames or [])
+            
+            # Tk widgets must be created on the main thread
+            self.root.after(0, self.build_editor, data, fieldnames)
+            
+        except Exception as e:
+            self.root.after(0, self.handle_editor_error, e)
+    
+    def build_editor(self, data, fieldnames):
+        """Create the editor on the main GUI thread and show it"""
+        try:
+            from driver_table_editor import DriverTableEditor
+            
+            # Large tables show the first chunk right away and populate the rest lazily
+            deferred_data = None
+            if len(data) > EDITOR_LAZY_LOAD_THRESHOLD:
+                data, deferred_data = data[:EDITOR_CHUNK_SIZE], data[EDITOR_CHUNK_SIZE:]
             
             # Create the editor (this can take a moment with large datasets)
             editor = DriverTableEditor(
@@ -401,19 +555,24 @@ Click 'Extract & Edit Talent Data' to extract driver data and open the editor.
                 fieldnames, 
                 "result.csv",
                 self.install_folder.get(),
-                self.teams_folder.get()
+                self.teams_folder.get(),
+                deferred_data=deferred_data
             )
             
-            # Schedule on main thread: hide main window and show editor
-            self.root.after(0, self.show_editor, editor)
-            
         except Exception as e:
-            logger.error(f"Error creating editor: {e}")
-            self.root.after(0, lambda: messagebox.showerror("Error", 
-                f"Error creating editor:\n{str(e)}"))
-            self.root.after(0, lambda: self.root.deiconify())
-            self.root.after(0, lambda: self.loading_label.config(text="", foreground=""))
-            self.root.after(0, self.enable_buttons)
+            self.handle_editor_error(e)
+            return
+        
+        # Hide main window and show editor
+        self.show_editor(editor)
+    
+    def handle_editor_error(self, error):
+        """Handle editor creation error on the main GUI thread"""
+        logger.error(f"Error creating editor: {error}")
+        messagebox.showerror("Error", f"Error creating editor:\n{str(error)}")
+        self.root.deiconify()
+        self.loading_label.config(text="", foreground="")
+        self.enable_buttons()
     
     def show_editor(self, editor):
         """Show the editor and hide the main window"""
@@ -455,6 +614,9 @@ Click 'Extract & Edit Talent Data' to extract driver data and open the editor.
     def safe_quit(self):
         """Safely quit the application"""
         try:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            if self._config_observer:
+                self._config_observer.stop()
             self.root.quit()
             self.root.destroy()
         except:
@@ -3,6 +3,7 @@
 
 import sys
 import os
+import multiprocessing
 
 def main():
     """Main function - launches GUI"""
@@ -17,17 +18,20 @@ def main():
         
     except ImportError as e:
         # Handle missing tkinter
-        print("\n" + "="*60)
-        print("ERROR: Missing GUI Dependencies")
-        print("="*60)
-        print("\nTkinter is required but not available.")
-        print("\nInstallation instructions:")
-        print("- Windows: Usually included with Python installation")
-        print("- Linux: sudo apt-get install python3-tk")
-        print("- macOS: Install ActiveTcl from http://www.activestate.com/activetcl")
-        print("\nAlternatively, install via package manager:")
-        print("  pip install tk")
-        print("="*60)
+        message = "\n".join([
+            "\n" + "="*60,
+            "ERROR: Missing GUI Dependencies",
+            "="*60,
+            "\nTkinter is required but not available.",
+            "\nInstallation instructions:",
+            "- Windows: Usually included with Python installation",
+            "- Linux: sudo apt-get install python3-tk",
+            "- macOS: Install ActiveTcl from http://www.activestate.com/activetcl",
+            "\nAlternatively, install via package manager:",
+            "  pip install tk",
+            "="*60,
+        ])
+        sys.stdout.write(message + "\n")
         sys.exit(1)
         
     except Exception as e:
@@ -38,4 +42,6 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Needed for the RCD parsing worker processes in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
@@ -2,9 +2,16 @@
 # matcher.py - Driver matching logic
 
 import os
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from debug_logger import logger
-# Add at the top of matcher.py
-from debug_analyzer import DebugAnalyzer
+from config import FUZZY_MATCH_SCORE_CUTOFF
+
+# Optional: RapidFuzz replaces the substring heuristics with a C++ fuzzy scorer
+try:
+    from rapidfuzz import fuzz, process as fuzz_process, utils as fuzz_utils
+except ImportError:
+    fuzz_process = None
 
 class DriverMatcher:
     """Handles matching drivers from .car files with RCD data"""
@@ -27,48 +34,82 @@ class DriverMatcher:
         
         result_data = []
         fieldnames = ['Driver', 'Source_CAR_File', 'CAR_File_Path']
+        fieldnames_set = set(fieldnames)
         found_drivers = []
         missing_drivers = []
+        matched_lines = []
         
         # Track which RCD drivers have already been used
         used_rcd_drivers = set()
         
-        for driver in sorted(car_drivers):
-            matched_driver = DriverMatcher._find_best_match(driver, rcd_data.keys(), used_rcd_drivers, debug)
+        # Lowercase and index every RCD name once instead of once per .car driver
+        rcd_index = DriverMatcher._build_rcd_index(rcd_data)
+        
+        # Many drivers share a .car file, so take each file's basename once
+        car_file_names = {path: os.path.basename(path) for path in set(driver_source_map.values())}
+        
+        # Lowercase and split each .car name once, up front. Most specific names
+        # (most words, then longest) go first so they claim their RCD entries
+        # before short ambiguous names like "Alex" can
+        drivers_sorted = sorted(car_drivers, key=lambda d: (-len(d.split()), -len(d), d))
+        drivers_lower = [driver.lower() for driver in drivers_sorted]
+        
+        # .car name -> claimed RCD name, or None when missing / already claimed
+        claimed = {}
+        for driver, driver_lower in zip(drivers_sorted, drivers_lower):
+            matched_driver = DriverMatcher._find_best_match(
+                driver, driver_lower, driver_lower.split(), rcd_index, used_rcd_drivers, debug
+            )
             
             if matched_driver and matched_driver not in used_rcd_drivers:
-                driver_info = rcd_data[matched_driver].copy()
-                driver_info['Driver'] = matched_driver
-                driver_info['Source_CAR_File'] = os.path.basename(
-                    driver_source_map.get(driver, "Unknown")
-                )
-                driver_info['CAR_File_Path'] = driver_source_map.get(driver, "Unknown")
-                
-                if driver != matched_driver:
-                    driver_info['Original_CAR_Name'] = driver
-                
-                # Update fieldnames
-                for key in driver_info.keys():
-                    if key not in fieldnames:
-                        fieldnames.append(key)
-                
-                result_data.append(driver_info)
-                found_drivers.append(driver)
+                claimed[driver] = matched_driver
                 used_rcd_drivers.add(matched_driver)
-                
-                if driver == matched_driver:
-                    logger.success(f"Found RCD data for: {driver}")
-                else:
-                    logger.success(f"Found RCD data for: {driver} -> matched as: {matched_driver}")
-            elif matched_driver and matched_driver in used_rcd_drivers:
+            elif matched_driver:
                 # This RCD driver was already matched to another .car driver
                 if debug:
                     logger.debug(f"RCD driver '{matched_driver}' already used, skipping duplicate for '{driver}'")
                 # Still count as found but don't add duplicate
+                claimed[driver] = None
                 found_drivers.append(driver)
             else:
                 missing_drivers.append(driver)
-                logger.error(f"No RCD data for: {driver}")
+        
+        # Rows (and the CSV columns) keep alphabetical .car name order; only the
+        # matching above runs most-specific first
+        for driver in sorted(claimed):
+            matched_driver = claimed[driver]
+            if matched_driver is None:
+                continue
+            
+            car_file_path = driver_source_map.get(driver, "Unknown")
+            driver_info = {
+                **rcd_data[matched_driver],
+                'Driver': matched_driver,
+                'Source_CAR_File': car_file_names.get(car_file_path, "Unknown"),
+                'CAR_File_Path': car_file_path,
+            }
+            
+            if driver != matched_driver:
+                driver_info['Original_CAR_Name'] = driver
+            
+            # Update fieldnames (keeping first-seen order for the CSV columns)
+            new_keys = [key for key in driver_info if key not in fieldnames_set]
+            fieldnames.extend(new_keys)
+            fieldnames_set.update(new_keys)
+            
+            result_data.append(driver_info)
+            found_drivers.append(driver)
+            
+            if driver == matched_driver:
+                matched_lines.append(f"Found RCD data for: {driver}")
+            else:
+                matched_lines.append(f"Found RCD data for: {driver} -> matched as: {matched_driver}")
+        
+        missing_drivers.sort()
+        
+        # Per-driver results are printed in one batch per level after the loop
+        logger.log_lines(matched_lines, "SUCCESS")
+        logger.log_lines([f"No RCD data for: {driver}" for driver in missing_drivers], "ERROR")
         
         DriverMatcher._show_matching_summary(car_drivers, found_drivers, missing_drivers, debug)
         
@@ -83,54 +124,201 @@ class DriverMatcher:
                     logger.debug(f"  Original name in .car: {item['Original_CAR_Name']}")
         
         if debug:
+            # Only debug runs pay for this import
+            from debug_analyzer import DebugAnalyzer
             DebugAnalyzer.analyze_duplicates(result_data, debug)
 
         return result_data, fieldnames, len(found_drivers), len(missing_drivers)
     
     @staticmethod
-    def _find_best_match(driver_name, rcd_driver_names, used_rcd_drivers, debug=False):
-        """Find the best matching driver in RCD data"""
-        driver_lower = driver_name.lower()
+    def _build_rcd_index(rcd_driver_names):
+        """
+        Build lookup indexes over RCD driver names
+        
+        Returns:
+            Dict with:
+              'exact': lowercased full name -> list of RCD names
+              'tokens': lowercased name token -> list of RCD names containing it
+              'lowered': list of (lowercased name, RCD name) in original order
+              'names' / 'fuzzy_choices' / 'fuzzy_lengths': RCD names, their
+                  RapidFuzz-processed forms and lengths, sorted by length
+                  (only with RapidFuzz)
+              'fuzzy_max_len_ratio': length ratio above which WRatio cannot
+                  reach the cutoff, or None
+              'positions' / 'haystack' / 'starts': lowercased name -> indexes
+                  into 'lowered', all lowercased names joined by newlines and
+                  where each one starts
+              'sorted_tokens': distinct name tokens in sorted order, for
+                  prefix lookups by bisection
+        """
+        exact = defaultdict(list)
+        tokens = defaultdict(list)
+        lowered = []
         
-        # 1. Try exact match (case-insensitive)
         for rcd_driver in rcd_driver_names:
-            if rcd_driver.lower() == driver_lower and rcd_driver not in used_rcd_drivers:
+            rcd_lower = rcd_driver.lower()
+            exact[rcd_lower].append(rcd_driver)
+            for token in dict.fromkeys(rcd_lower.split()):
+                tokens[token].append(rcd_driver)
+            lowered.append((rcd_lower, rcd_driver))
+        
+        positions = defaultdict(list)
+        starts = []
+        offset = 0
+        for idx, (rcd_lower, _) in enumerate(lowered):
+            positions[rcd_lower].append(idx)
+            starts.append(offset)
+            offset += len(rcd_lower) + 1
+        
+        index = {
+            'exact': exact,
+            'tokens': tokens,
+            'lowered': lowered,
+            'positions': positions,
+            'haystack': '\n'.join(rcd_lower for rcd_lower, _ in lowered),
+            'starts': starts,
+            'sorted_tokens': sorted(tokens),
+        }
+        
+        if fuzz_process is not None:
+            processed = sorted(
+                ((fuzz_utils.default_process(rcd_driver), rcd_driver) for _, rcd_driver in lowered),
+                key=lambda item: len(item[0])
+            )
+            index['names'] = [rcd_driver for _, rcd_driver in processed]
+            index['fuzzy_choices'] = [choice for choice, _ in processed]
+            index['fuzzy_lengths'] = [len(choice) for choice, _ in processed]
+            index['fuzzy_max_len_ratio'] = DriverMatcher._wratio_max_len_ratio(FUZZY_MATCH_SCORE_CUTOFF)
+        
+        return index
+    
+    @staticmethod
+    def _find_best_match(driver_name, driver_lower, driver_parts, rcd_index, used_rcd_drivers, debug=False):
+        """Find the best matching driver in RCD data (driver_lower/driver_parts precomputed by the caller)"""
+        candidates = DriverMatcher._candidates(driver_name, driver_lower, driver_parts, rcd_index, debug)
+        return DriverMatcher._pick(candidates, used_rcd_drivers)
+    
+    @staticmethod
+    def _pick(candidates, used_rcd_drivers):
+        """Return the first candidate not already matched, or None"""
+        for rcd_driver in candidates:
+            if rcd_driver not in used_rcd_drivers:
                 return rcd_driver
+        return None
+    
+    @staticmethod
+    def _candidates(driver_name, driver_lower, driver_parts, rcd_index, debug=False):
+        """Ordered RCD names that could match a driver, best first (used names are filtered by _pick)"""
+        tokens = rcd_index['tokens']
         
-        # 2. Try to match by name parts
-        driver_parts = driver_name.split()
+        # 1. Exact match (case-insensitive)
+        candidates = list(rcd_index['exact'].get(driver_lower, ()))
         
-        # If driver has multiple parts (e.g., "Matteo Bobbi")
+        # 2. Match by name parts
+        # If driver has multiple parts (e.g., "Matteo Bobbi"): last name, then first name
         if len(driver_parts) > 1:
-            # Try last name
-            last_name = driver_parts[-1]
-            for rcd_driver in rcd_driver_names:
-                if rcd_driver not in used_rcd_drivers and last_name.lower() in rcd_driver.lower():
-                    return rcd_driver
-            
-            # Try first name
-            first_name = driver_parts[0]
-            for rcd_driver in rcd_driver_names:
-                if rcd_driver not in used_rcd_drivers and first_name.lower() in rcd_driver.lower():
-                    return rcd_driver
+            candidates.extend(tokens.get(driver_parts[-1], ()))
+            candidates.extend(tokens.get(driver_parts[0], ()))
         
-        # 3. Try single word match (e.g., "Laurence")
+        # 3. Single word match (e.g., "Laurence")
         elif len(driver_parts) == 1:
-            name_part = driver_parts[0].lower()
-            for rcd_driver in rcd_driver_names:
-                if rcd_driver not in used_rcd_drivers and name_part in rcd_driver.lower():
-                    return rcd_driver
+            candidates.extend(tokens.get(driver_parts[0], ()))
+            
+            # 3b. Name tokens starting with the word (e.g., "Laur" -> "Laurence Smith")
+            sorted_tokens = rcd_index['sorted_tokens']
+            name_part = driver_parts[0]
+            for pos in range(bisect_left(sorted_tokens, name_part), len(sorted_tokens)):
+                token = sorted_tokens[pos]
+                if not token.startswith(name_part):
+                    break
+                candidates.extend(tokens[token])
         
-        # 4. Try any partial match
-        for rcd_driver in rcd_driver_names:
-            if rcd_driver not in used_rcd_drivers and (
-                driver_lower in rcd_driver.lower() or 
-                rcd_driver.lower() in driver_lower
-            ):
-                return rcd_driver
+        # 4. Any partial match
+        candidates.extend(DriverMatcher._partial_candidates(driver_lower, rcd_index))
+        
+        # 5. Fuzzy match when RapidFuzz is available: last, so it only adds matches
+        if fuzz_process is not None:
+            candidates.extend(DriverMatcher._fuzzy_candidates(driver_name, rcd_index, debug))
+        
+        return tuple(dict.fromkeys(candidates))
+    
+    @staticmethod
+    def _partial_candidates(driver_lower, rcd_index):
+        """
+        RCD names containing driver_lower or contained in it, in RCD order
+        
+        Multi-pattern search instead of testing every RCD name: one C-level
+        find() pass over all names joined by newlines, plus a dict lookup of
+        every substring of the (short) driver name.
+        """
+        lowered = rcd_index['lowered']
+        if not driver_lower:
+            return [rcd_driver for _, rcd_driver in lowered]
+        
+        hits = set()
         
+        # RCD names that contain the driver name
+        haystack = rcd_index['haystack']
+        starts = rcd_index['starts']
+        pos = haystack.find(driver_lower)
+        while pos != -1:
+            idx = bisect_right(starts, pos) - 1
+            hits.add(idx)
+            if idx + 1 == len(starts):
+                break
+            pos = haystack.find(driver_lower, starts[idx + 1])
+        
+        # RCD names that are contained in the driver name
+        positions = rcd_index['positions']
+        length = len(driver_lower)
+        for start in range(length):
+            for end in range(start + 1, length + 1):
+                found = positions.get(driver_lower[start:end])
+                if found:
+                    hits.update(found)
+        
+        return [lowered[idx][1] for idx in sorted(hits)]
+    
+    @staticmethod
+    def _wratio_max_len_ratio(score_cutoff):
+        """
+        Longest/shortest length ratio beyond which WRatio can't reach score_cutoff
+        
+        Once one string is more than 8x longer than the other, WRatio scales
+        partial matches by 0.6 and the plain ratio is at most 22, so no such
+        pair can score above 60.
+        """
+        if score_cutoff > 60:
+            return 8
         return None
     
+    @staticmethod
+    def _fuzzy_candidates(driver_name, rcd_index, debug=False):
+        """Top RCD names by RapidFuzz WRatio score, above the configured cutoff"""
+        query = fuzz_utils.default_process(driver_name)
+        choices = rcd_index['fuzzy_choices']
+        names = rcd_index['names']
+        
+        # Only score names whose length can still reach the cutoff (choices are sorted by length)
+        max_ratio = rcd_index['fuzzy_max_len_ratio']
+        if max_ratio and query:
+            lengths = rcd_index['fuzzy_lengths']
+            start = bisect_left(lengths, len(query) / max_ratio)
+            end = bisect_right(lengths, len(query) * max_ratio)
+            choices = choices[start:end]
+            names = names[start:end]
+        
+        hits = fuzz_process.extract(
+            query, choices, scorer=fuzz.WRatio, processor=None,
+            score_cutoff=FUZZY_MATCH_SCORE_CUTOFF, limit=5
+        )
+        
+        if debug and hits:
+            scores = ", ".join(f"'{names[idx]}' ({score:.0f})" for _, score, idx in hits)
+            logger.debug(f"Fuzzy candidates for '{driver_name}': {scores}")
+        
+        return [names[idx] for _, _, idx in hits]
+    
     @staticmethod
     def _show_matching_summary(car_drivers, found_drivers, missing_drivers, debug=False):
         """Show summary of matching results"""
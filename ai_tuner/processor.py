@@ -84,7 +84,7 @@ class DriverProcessor:
             else:
                 logger.warning(f"Folder does not exist: {folder}")
         
-        # Find and parse .rcd files in one step
+        # Find and parse .rcd files in one step (this also fills a complete driver cache)
         rcd_data = self.rcd_handler.parse_rcd_files(debug=self.debug_mode)
         
         if not rcd_data:
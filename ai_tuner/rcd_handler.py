@@ -1,10 +1,28 @@
 #!/usr/bin/env python3
 # rcd_handler.py - Unified RCD file handling (finder + parser + updater)
 
+import io
 import os
+import sys
+import json
 import shutil
+import multiprocessing
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from debug_logger import logger
-from config import RCD_EXTENSIONS, ENCODINGS, RCD_FIELD_MAP
+from file_reader import FileReader
+from config import (RCD_EXTENSIONS, RCD_FIELD_MAP, RCD_PARALLEL_MIN_FILES,
+                    RCD_PARALLEL_UPDATE_MIN_FILES, RCD_THREADED_MIN_FILES)
+
+# Lowercased RCD extensions (with leading dot) for O(1) filename checks
+_RCD_EXT_SET = frozenset(
+    ext.lower() if ext.startswith('.') else '.' + ext.lower() for ext in RCD_EXTENSIONS
+)
+
+# Sidecar in the backup folder remembering which drivers each RCD file held
+_INDEX_FILENAME = ".rcd_index.json"
+_INDEX_VERSION = 2
 
 class RcdHandler:
     """Unified handler for all RCD file operations (find, parse, update)"""
@@ -14,6 +32,8 @@ class RcdHandler:
         self.teams_folder = teams_folder
         self.backup_folder = "originals_backup"
         self._rcd_file_cache = {}  # Cache for faster lookups
+        self._cache_is_complete = False  # True once every RCD file in the search folders is cached
+        self._fingerprints = None  # RCD path -> (mtime_ns, size, driver names), loaded on first cache build
         
         # Use RCD_FIELD_MAP from config
         self.field_map = RCD_FIELD_MAP
@@ -34,8 +54,17 @@ class RcdHandler:
     
     def find_all_rcd_files(self, debug=False):
         """Find all .rcd files recursively in search folders"""
-        all_rcd_files = []
+        all_rcd_files = list(self.iter_rcd_files())
+        
+        # Build cache for faster driver lookups (complete even when no files were found)
+        self._build_driver_cache(all_rcd_files, debug)
+        
+        return all_rcd_files
+    
+    def iter_rcd_files(self):
+        """Yield .rcd files from all search folders lazily, as each folder is walked"""
         search_folders = self.get_search_folders()
+        total_count = 0
         
         logger.section("SEARCHING FOR .RCD FILES")
         
@@ -46,109 +75,229 @@ class RcdHandler:
                 logger.warning(f"Folder does not exist: {folder_path}")
                 continue
             
-            folder_rcd_files = self._scan_folder_for_rcd(folder_path)
-            all_rcd_files.extend(folder_rcd_files)
-            logger.info(f"Found {len(folder_rcd_files)} .rcd files in this folder")
-        
-        logger.info(f"Total .rcd files found: {len(all_rcd_files)}")
-        
-        # Build cache for faster driver lookups
-        if all_rcd_files:
-            self._build_driver_cache(all_rcd_files, debug)
+            folder_count = 0
+            for rcd_file in self._iter_rcd_files(folder_path):
+                folder_count += 1
+                yield rcd_file
+            
+            total_count += folder_count
+            logger.info(f"Found {folder_count} .rcd files in this folder")
         
-        return all_rcd_files
+        logger.info(f"Total .rcd files found: {total_count}")
     
-    def _scan_folder_for_rcd(self, folder_path):
-        """Scan a folder recursively for RCD files (optimized)"""
-        rcd_files = []
-        # Pre-compile extensions for faster checking
-        extensions = tuple(ext.lower() for ext in RCD_EXTENSIONS)
-        
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                if file.lower().endswith(extensions):
-                    rcd_files.append(os.path.join(root, file))
-        
-        return rcd_files
+    @staticmethod
+    def _iter_rcd_files(folder_path):
+        """Yield RCD files under a folder, one scandir per directory, in os.walk order"""
+        stack = [folder_path]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif os.path.splitext(entry.name)[1].lower() in _RCD_EXT_SET:
+                            yield entry.path
+            except OSError:
+                continue
+            
+            # Reversed so subfolders are popped (and yielded) in listing order
+            stack.extend(reversed(subdirs))
     
     def _build_driver_cache(self, rcd_files, debug=False):
-        """Build a cache of driver -> file mapping for faster lookups"""
+        """Build a cache of driver -> file mapping, re-reading only files changed since the last run"""
         logger.info("Building driver cache...")
+        if self._fingerprints is None:
+            self._load_index()
         self._rcd_file_cache = {}
+        fingerprints = {}
+        entries = []
+        stale_files = []
         
         for rcd_file in rcd_files:
-            drivers = self._extract_driver_names(rcd_file)
+            try:
+                stat = os.stat(rcd_file)
+            except OSError:
+                continue
+            
+            cached = self._fingerprints.get(rcd_file)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                drivers = cached[2]
+            else:
+                drivers = None
+                stale_files.append(rcd_file)
+            entries.append((rcd_file, stat, drivers))
+        
+        # Reading is I/O-bound, so threads overlap the opens/reads of many changed files
+        if len(stale_files) > RCD_THREADED_MIN_FILES:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            logger.info(f"Reading {len(stale_files)} changed files with {workers} threads")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                parsed = executor.map(self._parse_single_rcd_fast, stale_files)
+                fresh_drivers = {rcd_file: list(driver_data) for rcd_file, driver_data in zip(stale_files, parsed)}
+        else:
+            fresh_drivers = {rcd_file: list(self._parse_single_rcd_fast(rcd_file)) for rcd_file in stale_files}
+        
+        for rcd_file, stat, drivers in entries:
+            if drivers is None:
+                drivers = fresh_drivers[rcd_file]
+            fingerprints[rcd_file] = (stat.st_mtime_ns, stat.st_size, drivers)
             for driver in drivers:
                 self._rcd_file_cache[driver] = rcd_file
         
+        if fingerprints != self._fingerprints:
+            self._fingerprints = fingerprints
+            self._save_index()
+        
+        self._cache_is_complete = True
+        
         if debug:
-            logger.debug(f"Driver cache built: {len(self._rcd_file_cache)} entries")
+            logger.debug(f"Driver cache built: {len(self._rcd_file_cache)} entries "
+                         f"({len(entries) - len(stale_files)} files unchanged since last run)")
+    
+    def _index_path(self):
+        """Path of the driver index sidecar"""
+        return os.path.join(self.backup_folder, _INDEX_FILENAME)
     
-    def _extract_driver_names(self, file_path):
-        """Quickly extract driver names from RCD file without full parsing"""
-        drivers = []
+    def _load_index(self):
+        """Load file fingerprints and driver names saved by a previous run"""
+        self._fingerprints = {}
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.split('//')[0].strip()
-                    if line and '=' not in line and not line.startswith('{') and not line.startswith('}'):
-                        drivers.append(line)
-                        # Limit to first few drivers if we only need existence check
-                        if len(drivers) > 10:  # Arbitrary limit for cache building
-                            break
-        except:
-            pass
-        return drivers
+            with open(self._index_path(), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') == _INDEX_VERSION:
+                self._fingerprints = {path: tuple(entry) for path, entry in index['files'].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self._fingerprints = {}
+    
+    def _save_index(self):
+        """Write the driver index sidecar atomically"""
+        index_path = self._index_path()
+        temp_path = index_path + '.tmp'
+        try:
+            os.makedirs(self.backup_folder, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': _INDEX_VERSION, 'files': self._fingerprints}, f)
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            logger.warning(f"Could not save driver index: {e}")
     
     # =========================================================================
     # PARSING METHODS (OPTIMIZED)
     # =========================================================================
     
     def parse_rcd_files(self, rcd_file_paths=None, debug=False):
-        """Parse RCD files and extract driver data (optimized)"""
-        if not rcd_file_paths:
-            rcd_file_paths = self.find_all_rcd_files(debug)
+        """
+        Parse RCD files and extract driver data (optimized)
         
-        all_driver_data = {}
+        Args:
+            rcd_file_paths: Iterable of RCD paths; defaults to walking every search
+                folder, which also leaves the driver cache complete
+            debug: Enable debug output
+        
+        Returns:
+            Dict of driver name -> driver data
+        """
+        # Only a walk of every search folder leaves a complete driver cache
+        walks_all_folders = rcd_file_paths is None
+        if walks_all_folders:
+            rcd_file_paths = self.iter_rcd_files()
+        
+        # Paths are collected up front: the count picks serial vs. parallel parsing
+        rcd_file_paths = list(rcd_file_paths)
         
         logger.section("PARSING RCD FILES")
         
-        # Process in batches for better performance
-        batch_size = 5 if debug else 20
-        for i in range(0, len(rcd_file_paths), batch_size):
-            batch = rcd_file_paths[i:i + batch_size]
+        # The driver -> file cache is filled from the same pass, so files are read once
+        self._rcd_file_cache = {}
+        self._cache_is_complete = False
+        
+        # Large sets are parsed across processes (debug runs stay serial for readable output)
+        all_driver_data = None
+        if not debug and len(rcd_file_paths) >= RCD_PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
+            all_driver_data = self._parse_rcd_files_parallel(rcd_file_paths)
+        
+        if all_driver_data is None:
+            all_driver_data = self._parse_rcd_files_serial(rcd_file_paths, debug)
+        
+        self._cache_is_complete = walks_all_folders
+        
+        logger.info(f"Total drivers parsed from RCD: {len(all_driver_data)}")
+        return all_driver_data
+    
+    def _parse_rcd_files_serial(self, rcd_file_paths, debug=False):
+        """Parse RCD files one after another in this process"""
+        all_driver_data = {}
+        
+        # The first few files (or all, in debug) are logged in detail, then every 100th
+        total = len(rcd_file_paths)
+        for file_index, rcd_file_path in enumerate(rcd_file_paths, 1):
+            file_debug = debug or file_index <= 3
             
-            for j, rcd_file_path in enumerate(batch, 1):
-                file_index = i + j
-                file_debug = debug or file_index <= 3
-                
-                if file_debug:
-                    logger.progress(file_index, len(rcd_file_paths), 
-                                  f"Parsing: {os.path.basename(rcd_file_path)}")
-                
-                driver_data = self._parse_single_rcd_fast(rcd_file_path, file_debug)
-                all_driver_data.update(driver_data)
-                
-                if file_debug and driver_data:
-                    logger.info(f"Found {len(driver_data)} driver(s) in this file")
+            if file_debug or file_index % 100 == 0:
+                logger.progress(file_index, total, f"Parsing: {os.path.basename(rcd_file_path)}")
             
-            if i == 0 and not debug and len(rcd_file_paths) > batch_size:
-                logger.info(f"... (parsing {len(rcd_file_paths) - batch_size} more files)")
+            driver_data = self._parse_single_rcd_fast(rcd_file_path, file_debug)
+            all_driver_data.update(driver_data)
+            self._rcd_file_cache.update(dict.fromkeys(driver_data, rcd_file_path))
+            
+            if file_debug and driver_data:
+                logger.info(f"Found {len(driver_data)} driver(s) in this file")
+            
+            if file_index == 3 and not debug and total > 3:
+                logger.info(f"... (parsing {total - 3} more files)")
+        
+        return all_driver_data
+    
+    def _parse_rcd_files_parallel(self, rcd_file_paths):
+        """Parse RCD files in worker processes, or return None if no pool can be started"""
+        workers = os.cpu_count() or 1
+        logger.info(f"Parsing {len(rcd_file_paths)} files with {workers} worker processes")
+        
+        parsed = self._map_in_processes(RcdHandler._parse_single_rcd_fast, (rcd_file_paths,),
+                                        chunksize=16, action="parsing")
+        if parsed is None:
+            return None
+        
+        # Results keep file order, so later files still override earlier ones
+        all_driver_data = {}
+        for rcd_file_path, driver_data in zip(rcd_file_paths, parsed):
+            all_driver_data.update(driver_data)
+            self._rcd_file_cache.update(dict.fromkeys(driver_data, rcd_file_path))
         
-        logger.info(f"Total drivers parsed from RCD: {len(all_driver_data)}")
         return all_driver_data
     
-    def _parse_single_rcd_fast(self, rcd_file_path, debug=False):
-        """Fast parsing of a single RCD file using field patterns"""
-        content = self._read_file_fast(rcd_file_path, debug)
-        if not content:
+    @staticmethod
+    def _map_in_processes(func, iterables, chunksize, action):
+        """Map func over iterables in worker processes, in order, or return None if no pool can be started"""
+        try:
+            # Spawn rather than fork: this may run from a GUI worker thread
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=context) as executor:
+                return list(executor.map(func, *iterables, chunksize=chunksize))
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(f"Parallel {action} unavailable ({e}), {action} serially")
+            return None
+    
+    @staticmethod
+    def _iter_lines(text):
+        """Iterate decoded text line by line with the same newline handling as text-mode files"""
+        return io.StringIO(text, newline=None)
+    
+    @staticmethod
+    def _parse_single_rcd_fast(rcd_file_path, debug=False):
+        """Fast parsing of a single RCD file, read once and decoded in memory"""
+        try:
+            text, _ = FileReader.read_text(rcd_file_path)
+        except OSError:
+            if debug:
+                logger.error(f"Failed to read RCD file: {rcd_file_path}")
             return {}
         
         driver_data = {}
-        current_driver = None
-        lines = content.split('\n')
+        current_entry = None
         
-        for line in lines:
+        for line in RcdHandler._iter_lines(text):
             # Skip comments early
             comment_idx = line.find('//')
             if comment_idx != -1:
@@ -158,47 +307,35 @@ class RcdHandler:
             if not line:
                 continue
             
+            # Locate the first = once; it decides header vs. field line
+            eq_idx = line.find('=')
+            
             # Check if this is a driver name (no =, not { or })
-            if '=' not in line and not line.startswith('{') and not line.startswith('}'):
-                current_driver = line
-                if current_driver:
-                    driver_data[current_driver] = {'Driver': current_driver}
+            if eq_idx == -1:
+                if line[0] not in '{}':
+                    # Interned: the name is reused as a key through matching and updating
+                    line = sys.intern(line)
+                    # A repeated header continues the same entry instead of resetting it
+                    current_entry = driver_data.setdefault(line, {'Driver': line})
                     if debug:
-                        logger.debug(f"Found driver: '{current_driver}'")
+                        logger.debug(f"Found driver: '{line}'")
             
             # Check if this is a field we care about
-            elif '=' in line and current_driver:
-                # Fast split at first =
-                parts = line.split('=', 1)
-                if len(parts) == 2:
-                    key = parts[0].strip()
-                    
-                    # Fast lookup in field map from config
-                    if key in self.field_map:
-                        value = parts[1].split('//')[0].strip()
-                        driver_data[current_driver][key] = value
+            elif current_entry is not None:
+                key = line[:eq_idx].rstrip()
+                
+                # Fast lookup in field map from config (comment already stripped)
+                if key in RCD_FIELD_MAP:
+                    current_entry[key] = line[eq_idx + 1:].lstrip()
         
         return driver_data
     
-    def _read_file_fast(self, file_path, debug=False):
-        """Optimized file reading with encoding fallback"""
-        for encoding in ENCODINGS:
-            try:
-                with open(file_path, 'r', encoding=encoding, errors='ignore') as f:
-                    return f.read()
-            except:
-                continue
-        
-        if debug:
-            logger.error(f"Failed to read RCD file: {file_path}")
-        return None
-    
     # =========================================================================
     # UPDATING METHODS
     # =========================================================================
     
-    def update_rcd_files(self, csv_data, fieldnames, create_backup=True):
-        """Update RCD files with values from CSV data"""
+    def update_rcd_files(self, csv_data, fieldnames, create_backup=True, ignore_case=False):
+        """Update RCD files with values from CSV data (ignore_case matches field keys case-insensitively)"""
         logger.section("UPDATING RCD FILES")
         
         # Create backup folder if needed
@@ -213,86 +350,95 @@ class RcdHandler:
         error_count = 0
         updated_drivers = []
         
-        # Filter fieldnames to only include valid RCD fields from config
-        valid_fieldnames = [field for field in fieldnames if field in self.field_map]
-        if valid_fieldnames != fieldnames:
-            invalid_fields = set(fieldnames) - set(valid_fieldnames)
-            if invalid_fields:
-                logger.warning(f"Some fieldnames are not valid RCD fields and will be ignored: {invalid_fields}")
-        
-        # Process each driver
+        # Filter fieldnames to only include valid RCD fields from config, as a dict of
+        # per-line lookup key (lowercased with ignore_case) -> CSV field
+        known_keys = self._field_lookup(self.field_map, ignore_case)
+        valid_fieldnames = self._field_lookup(
+            (field for field in fieldnames if (field.lower() if ignore_case else field) in known_keys),
+            ignore_case
+        )
+        invalid_fields = set(fieldnames) - set(valid_fieldnames.values())
+        if invalid_fields:
+            logger.warning(f"Some fieldnames are not valid RCD fields and will be ignored: {invalid_fields}")
+        
+        self._ensure_driver_cache()
+        
+        # Group drivers by RCD file (from the driver cache) so each file is rewritten once
+        drivers_by_file = {}
         for driver_data in csv_data:
-            driver_name = driver_data.get('Driver', '')
+            # Interned like the parsed names, so cache lookups compare by identity
+            driver_name = sys.intern(driver_data.get('Driver', ''))
             if not driver_name:
                 continue
             
-            # Find RCD file using cache or search
             rcd_file_path = self.find_rcd_file_for_driver(driver_name)
-            
             if rcd_file_path:
-                # Create backup if requested
-                if backup_path:
-                    self._backup_if_needed(rcd_file_path, backup_path, driver_name)
-                
-                # Update RCD file
-                if self._update_single_rcd(rcd_file_path, driver_name, driver_data, valid_fieldnames):
+                drivers_by_file.setdefault(rcd_file_path, {})[driver_name] = driver_data
+            else:
+                error_count += 1
+                logger.error(f"RCD file not found for: {driver_name}")
+        
+        # Update each file (backed up first if requested and it actually changes);
+        # many files are rewritten across processes, like parsing
+        groups = list(drivers_by_file.items())
+        results = None
+        if len(groups) >= RCD_PARALLEL_UPDATE_MIN_FILES and (os.cpu_count() or 1) > 1:
+            results = self._update_rcd_files_parallel(groups, valid_fieldnames, backup_path, ignore_case)
+        
+        if results is None:
+            results = [self._update_single_rcd(rcd_file_path, targets, valid_fieldnames, backup_path, ignore_case)
+                       for rcd_file_path, targets in groups]
+        
+        for (rcd_file_path, targets), updated in zip(groups, results):
+            for driver_name in targets:
+                if updated:
                     success_count += 1
                     updated_drivers.append(driver_name)
                     logger.success(f"Updated: {driver_name}")
                 else:
                     error_count += 1
                     logger.error(f"Failed to update: {driver_name}")
-            else:
-                error_count += 1
-                logger.error(f"RCD file not found for: {driver_name}")
         
         # Summary
         self._print_update_summary(success_count, error_count, updated_drivers)
         
         return success_count, error_count, backup_path
     
-    def find_rcd_file_for_driver(self, driver_name):
-        """Find RCD file for a driver (uses cache if available)"""
-        # Check cache first
-        if driver_name in self._rcd_file_cache:
-            return self._rcd_file_cache[driver_name]
-        
-        # Fallback to search
-        return self._search_driver_in_folders(driver_name)
+    def _update_rcd_files_parallel(self, groups, fieldnames, backup_path, ignore_case=False):
+        """Rewrite RCD files in worker processes, or return None if no pool can be started"""
+        workers = os.cpu_count() or 1
+        logger.info(f"Updating {len(groups)} files with {workers} worker processes")
+        
+        rcd_file_paths = [rcd_file_path for rcd_file_path, _ in groups]
+        backup_file_paths = [self._backup_file_path(rcd_file_path, backup_path) if backup_path else None
+                             for rcd_file_path in rcd_file_paths]
+        
+        return self._map_in_processes(
+            RcdHandler._rewrite_rcd,
+            (rcd_file_paths, [targets for _, targets in groups], repeat(fieldnames),
+             backup_file_paths, repeat(ignore_case)),
+            chunksize=8, action="updating"
+        )
     
-    def _search_driver_in_folders(self, driver_name):
-        """Search for driver in all RCD folders"""
-        search_folders = self.get_search_folders()
-        
-        for folder in search_folders:
-            if os.path.exists(folder):
-                rcd_file = self._find_driver_in_folder(folder, driver_name)
-                if rcd_file:
-                    return rcd_file
-        
-        return None
+    @staticmethod
+    def _field_lookup(fieldnames, ignore_case=False):
+        """Map each field's per-line lookup key to its CSV field (first spelling wins)"""
+        lookup = {}
+        for field in fieldnames:
+            lookup.setdefault(field.lower() if ignore_case else field, field)
+        return lookup
     
-    def _find_driver_in_folder(self, folder, driver_name):
-        """Search for driver in a specific folder"""
-        for root, _, files in os.walk(folder):
-            for file in files:
-                if file.lower().endswith('.rcd'):
-                    file_path = os.path.join(root, file)
-                    if self._driver_exists_in_file(file_path, driver_name):
-                        return file_path
-        return None
+    def _ensure_driver_cache(self):
+        """Make the driver cache cover every RCD file in the search folders"""
+        # Cheap when the index sidecar is current: only changed files are re-read
+        if not self._cache_is_complete:
+            self.find_all_rcd_files()
     
-    def _driver_exists_in_file(self, file_path, driver_name):
-        """Check if driver exists in file (optimized)"""
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.split('//')[0].strip()
-                    if line == driver_name:
-                        return True
-        except:
-            pass
-        return False
+    def find_rcd_file_for_driver(self, driver_name):
+        """Find RCD file for a driver, or None if no RCD file defines it"""
+        # The complete cache covers every file, so a miss means no such driver
+        self._ensure_driver_cache()
+        return self._rcd_file_cache.get(driver_name)
     
     def _ensure_backup_folder(self):
         """Create backup folder if it doesn't exist"""
@@ -303,24 +449,26 @@ class RcdHandler:
             logger.error(f"Failed to create backup folder: {e}")
             return None
     
-    def _backup_if_needed(self, rcd_file_path, backup_path, driver_name):
+    def _backup_file_path(self, rcd_file_path, backup_path):
+        """Where an RCD file's backup goes (folder structure preserved), or None"""
+        rel_path = self._get_relative_path(rcd_file_path)
+        if not rel_path:
+            logger.warning(f"Cannot determine relative path for: {rcd_file_path}")
+            return None
+        return os.path.join(backup_path, rel_path)
+    
+    @staticmethod
+    def _backup_if_needed(rcd_file_path, backup_file_path, driver_name):
         """Create backup if file hasn't been backed up yet"""
         try:
-            rel_path = self._get_relative_path(rcd_file_path)
-            if not rel_path:
-                logger.warning(f"Cannot determine relative path for: {rcd_file_path}")
-                return False
-            
-            backup_file_path = os.path.join(backup_path, rel_path)
-            
             if os.path.exists(backup_file_path):
                 return True  # Already backed up
             
             # Create parent directories
             os.makedirs(os.path.dirname(backup_file_path), exist_ok=True)
             
-            # Copy file
-            shutil.copy2(rcd_file_path, backup_file_path)
+            # Copy contents only; the backup doesn't need the original's metadata
+            shutil.copyfile(rcd_file_path, backup_file_path)
             logger.debug(f"Backup created for: {driver_name}")
             return True
             
@@ -343,84 +491,125 @@ class RcdHandler:
         
         return None
     
-    def _update_single_rcd(self, rcd_file_path, driver_name, driver_data, fieldnames):
-        """Update a single RCD file with optimized parsing"""
+    def _update_single_rcd(self, rcd_file_path, targets, fieldnames, backup_path=None, ignore_case=False):
+        """Update every target driver in a single RCD file, backing it up into backup_path if it changes"""
+        backup_file_path = self._backup_file_path(rcd_file_path, backup_path) if backup_path else None
+        return self._rewrite_rcd(rcd_file_path, targets, fieldnames, backup_file_path, ignore_case)
+    
+    @staticmethod
+    def _rewrite_rcd(rcd_file_path, targets, fieldnames, backup_file_path=None, ignore_case=False):
+        """
+        Update every target driver in a single RCD file in one pass
+        
+        Stateless, so it can also run in a worker process.
+        
+        Args:
+            rcd_file_path: RCD file to rewrite
+            targets: Dict of driver name -> driver data for drivers in this file
+            fieldnames: Dict of field key (lowercased with ignore_case) -> CSV field to update
+            backup_file_path: Where to back the file up, used only if it actually changes
+            ignore_case: Match field keys in the file case-insensitively
+        
+        Returns:
+            True on success (including when nothing needed changing)
+        """
+        temp_path = rcd_file_path + '.tmp'
+        modified = False
         try:
-            with open(rcd_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-            
-            updated_lines = []
-            in_target_block = False
-            brace_depth = 0
+            # Written back in the encoding it was read with, so other characters survive
+            text, encoding = FileReader.read_text(rcd_file_path)
             
-            for line in lines:
-                original = line.rstrip('\n')
+            # Write into a sibling temp file and swap it in, so a failure never leaves a half-written RCD
+            with open(temp_path, 'w', encoding=encoding) as dst:
+                driver_data = None  # Data of the target driver whose block we're in
+                brace_depth = 0
                 
-                # Check for driver block start
-                if not in_target_block:
-                    clean_line = original.split('//')[0].strip()
-                    if clean_line == driver_name:
-                        in_target_block = True
+                for line in RcdHandler._iter_lines(text):
+                    original = line.rstrip('\n')
+                    
+                    # Check for a target driver's block start
+                    if driver_data is None:
+                        driver_data = targets.get(original.partition('//')[0].strip())
                         brace_depth = 0
-                
-                # Process line
-                if in_target_block:
-                    # Update brace depth
-                    brace_depth += original.count('{')
-                    brace_depth -= original.count('}')
                     
-                    # Check for fields to update
-                    if '=' in original and brace_depth > 0:
-                        updated_line = self._update_line_if_needed(original, driver_data, fieldnames)
-                        updated_lines.append(updated_line + '\n')
+                    # Process line
+                    if driver_data is not None:
+                        # Update brace depth
+                        brace_depth += original.count('{')
+                        brace_depth -= original.count('}')
+                        
+                        # Check for fields to update
+                        if '=' in original and brace_depth > 0:
+                            updated, changed = RcdHandler._update_line_if_needed(
+                                original, driver_data, fieldnames, ignore_case
+                            )
+                            modified = modified or changed
+                            dst.write(updated + '\n')
+                        else:
+                            dst.write(original + '\n')
+                        
+                        # Check if block ended
+                        if brace_depth == 0 and '}' in original:
+                            driver_data = None
                     else:
-                        updated_lines.append(original + '\n')
-                    
-                    # Check if block ended
-                    if brace_depth == 0 and in_target_block and '}' in original:
-                        in_target_block = False
-                else:
-                    updated_lines.append(original + '\n')
+                        dst.write(original + '\n')
+            
+            # Same values as on disk: leave the file (and its backup) alone
+            if not modified:
+                RcdHandler._remove_temp_file(temp_path)
+                return True
             
-            # Write back to file
-            with open(rcd_file_path, 'w', encoding='utf-8') as f:
-                f.writelines(updated_lines)
+            if backup_file_path:
+                RcdHandler._backup_if_needed(rcd_file_path, backup_file_path, ", ".join(targets))
             
+            shutil.copymode(rcd_file_path, temp_path)
+            os.replace(temp_path, rcd_file_path)
             return True
             
         except Exception as e:
             logger.error(f"Error updating {rcd_file_path}: {e}")
+            RcdHandler._remove_temp_file(temp_path)
             return False
     
-    def _update_line_if_needed(self, line, driver_data, fieldnames):
-        """Update a single line if it contains a field we need to update"""
+    @staticmethod
+    def _remove_temp_file(temp_path):
+        """Remove a leftover temp file, ignoring errors"""
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _update_line_if_needed(line, driver_data, fieldnames, ignore_case=False):
+        """
+        Update a single line if it contains a field we need to update
+        
+        Returns:
+            Tuple of (line, changed); an unchanged value keeps the line as-is, padding included
+        """
         # Find first = and preserve structure
         eq_index = line.find('=')
         if eq_index == -1:
-            return line
+            return line, False
         
         # Extract key
         key_part = line[:eq_index]
         key = key_part.strip()
         
         # Check if this is a field we want to update
-        if key in fieldnames:
-            new_value = driver_data.get(key, '')
-            if str(new_value) != '':
-                # Preserve indent and comments
-                indent = key_part[:len(key_part) - len(key_part.lstrip())]
-                value_part = line[eq_index + 1:]
-                
-                # Preserve comments
-                comment = ''
-                if '//' in value_part:
-                    comment_idx = value_part.index('//')
-                    comment = value_part[comment_idx:]
-                    value_part = value_part[:comment_idx]
+        field = fieldnames.get(key.lower() if ignore_case else key)
+        if field is not None:
+            new_value = str(driver_data.get(field, ''))
+            if new_value != '':
+                value, comment_sep, comment = line[eq_index + 1:].partition('//')
+                if value.strip() == new_value:
+                    return line, False
                 
-                return f"{indent}{key}={new_value}{comment}"
+                # Preserve indent (everything before the key) and comments
+                indent = key_part[:key_part.find(key)]
+                return f"{indent}{key}={new_value}{comment_sep}{comment}", True
         
-        return line
+        return line, False
     
     def _print_update_summary(self, success_count, error_count, updated_drivers):
         """Print update summary"""